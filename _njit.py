@@ -0,0 +1,69 @@
+"""Numba-compiled indicator kernels over raw candle arrays"""
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Run as plain Python without numba
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def analyze_kernel(high, low, close):
+    """Last (ema20, ema50, atr14, support, resistance, winrate) in a single pass"""
+    n = close.size
+    a20 = 2.0 / 21.0
+    a50 = 2.0 / 51.0
+    ema20 = 0.0
+    ema50 = 0.0
+    atr14 = 0.0
+    up = 0
+    support = np.inf
+    resistance = -np.inf
+
+    for i in range(n):
+        x = close[i]
+
+        # SMA-seeded EMAs and Wilder ATR, matching TA-Lib
+        if i < 20:
+            ema20 += x
+            if i == 19:
+                ema20 /= 20.0
+        else:
+            ema20 = a20 * x + (1.0 - a20) * ema20
+
+        if i < 50:
+            ema50 += x
+            if i == 49:
+                ema50 /= 50.0
+        else:
+            ema50 = a50 * x + (1.0 - a50) * ema50
+
+        if i > 0:
+            prev = close[i - 1]
+            if x > prev:
+                up += 1
+            tr = max(high[i] - low[i], abs(high[i] - prev), abs(low[i] - prev))
+            if i <= 14:
+                atr14 += tr
+                if i == 14:
+                    atr14 /= 14.0
+            else:
+                atr14 = (atr14 * 13.0 + tr) / 14.0
+
+        # Support/resistance over the last 50 bars
+        if i >= n - 50:
+            support = min(support, low[i])
+            resistance = max(resistance, high[i])
+
+    if n < 20:
+        ema20 = np.nan
+    if n < 50:
+        ema50 = np.nan
+    if n < 15:
+        atr14 = np.nan
+    winrate = up / (n - 1) if n > 1 else np.nan
+    return ema20, ema50, atr14, support, resistance, winrate
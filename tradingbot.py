@@ -1,13 +1,30 @@
+# -*- coding: utf-8 -*-
 from flask import Flask, request, jsonify
 from twilio.twiml.messaging_response import MessagingResponse
+import orjson
 import requests
-import pandas as pd
-import pandas_ta as ta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 import os
+import json
 import time
+import asyncio
+import threading
+from dataclasses import dataclass
+from concurrent.futures import Future, ThreadPoolExecutor
 from dotenv import load_dotenv
 import logging
 
+from _njit import analyze_kernel
+
+import talib
+
+try:
+    import websockets
+except ImportError:  # Streaming is optional; REST polling still works without it
+    websockets = None
+
 # Load environment variables
 load_dotenv()
 
@@ -20,6 +37,8 @@ app = Flask(__name__)
 DERIV_API_KEY = os.getenv('DERIV_API_KEY')
 DERIV_APP_ID = os.getenv('DERIV_APP_ID')
 DERIV_API_URL = "https://api.deriv.com"
+DERIV_WS_URL = f"wss://ws.derivws.com/websockets/v3?app_id={DERIV_APP_ID}"
+CANDLE_COUNT = 200
 
 SYMBOL_MAP = {
     # Volatility Indices
@@ -64,22 +83,145 @@ SYMBOL_MAP = {
     "FTSE100": "UK100"
 }
 
+# Only known Deriv symbols are streamed and cached; anything else goes straight to REST
+KNOWN_API_SYMBOLS = frozenset(SYMBOL_MAP.values())
+
 TIMEFRAMES = {
     'analysis': '15m',
     'sl': '5m',
     'entry': '1m'
 }
+
+GRANULARITY_SECONDS = {'1m': 60, '5m': 300, '15m': 900}
+TIMEFRAME_BY_SECONDS = {seconds: tf for tf, seconds in GRANULARITY_SECONDS.items()}
+
+class TokenBucket:
+    """Thread-safe token bucket: allows bursts up to capacity, then paces at rate/sec"""
+
+    def __init__(self, capacity, rate):
+        self.capacity = capacity
+        self.rate = rate
+        self.tokens = float(capacity)
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Take one token, sleeping only while the bucket is empty"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+# Deriv API rate limit
+BUCKET = TokenBucket(capacity=5, rate=1.0)
+
+# Keep-alive connection pool to the Deriv API, retrying rate-limit and server errors with backoff
+SESSION = requests.Session()
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+))
+REQUEST_TIMEOUT = (3.05, 10)  # (connect, read) seconds; Retry alone doesn't bound a hung read
+
+# Candle cache: (api_symbol, timeframe) -> (fetched_at, Candles or None)
+CACHE_TTL = {'1m': 30, '5m': 120, '15m': 300}
+NEGATIVE_CACHE_TTL = 5  # Failed fetches are remembered briefly to avoid hammering the API
+_CACHE = {}
+_INFLIGHT = {}  # (api_symbol, timeframe) -> Future shared by concurrent cache misses
+_CACHE_LOCK = threading.Lock()
+
+# Live candle buffers fed by the WebSocket stream: (api_symbol, timeframe) -> CandleBuffer
+_BUFFERS = {}
+# Incrementally updated indicators: (api_symbol, timeframe, name) -> StreamingEMA/StreamingATR
+_INDICATORS = {}
+STREAM_INDICATORS = ('ema20', 'ema50', 'atr14')
+_SUBSCRIPTIONS = set()
+_STREAM_LOCK = threading.Lock()
+_stream_loop = None
+_stream_ws = None
+
+# Shared pool so the three timeframe fetches of a webhook run concurrently
+FETCH_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="deriv-fetch")
 # =====================================
 
+@dataclass(frozen=True)
+class Candles:
+    """Oldest-to-newest candles as one contiguous float64 array per field"""
+    o: np.ndarray
+    h: np.ndarray
+    l: np.ndarray
+    c: np.ndarray
+
+    def __len__(self):
+        return self.c.size
+
 def convert_symbol(symbol):
     """Convert to Deriv's official symbol format"""
-    return SYMBOL_MAP.get(symbol.upper(), symbol)
+    return convert_symbol_upper(symbol.upper())
+
+def convert_symbol_upper(symbol):
+    """convert_symbol for callers that have already uppercased the symbol"""
+    return SYMBOL_MAP.get(symbol, symbol)
 
 def get_deriv_data(symbol, timeframe):
+    """Historical candles from the live stream, else the TTL cache or REST"""
+    # symbol must already be uppercase; returned arrays are shared, don't mutate them
+    api_symbol = convert_symbol_upper(symbol)
+    candles = stream_candles(api_symbol, timeframe)
+    if candles is not None:
+        return candles
+    stream_subscribe(api_symbol, timeframe)
+    if api_symbol not in KNOWN_API_SYMBOLS:
+        # Keep user-supplied symbols out of the cache so it stays bounded
+        return fetch_deriv_data(api_symbol, timeframe)
+
+    key = (api_symbol, timeframe)
+    now = time.time()
+
+    with _CACHE_LOCK:
+        cached = _CACHE.get(key)
+        if cached is not None:
+            fetched_at, candles = cached
+            ttl = CACHE_TTL.get(timeframe, 0) if candles is not None else NEGATIVE_CACHE_TTL
+            if now - fetched_at < ttl:
+                return candles
+
+        # Single-flight: only the first caller for a key hits the API, the rest wait on it
+        future = _INFLIGHT.get(key)
+        if future is None:
+            future = _INFLIGHT[key] = Future()
+            leader = True
+        else:
+            leader = False
+
+    if not leader:
+        return future.result()
+
+    try:
+        candles = fetch_deriv_data(api_symbol, timeframe)
+    except BaseException as e:
+        with _CACHE_LOCK:
+            del _INFLIGHT[key]
+        future.set_exception(e)
+        raise
+
+    with _CACHE_LOCK:
+        _CACHE[key] = (time.time(), candles)
+        del _INFLIGHT[key]
+    future.set_result(candles)
+    return candles
+
+def fetch_deriv_data(api_symbol, timeframe):
     """Fetch historical data from Deriv API"""
     try:
-        time.sleep(1)  # Rate limiting
-        api_symbol = convert_symbol(symbol)
+        BUCKET.acquire()  # Rate limiting
         url = f"{DERIV_API_URL}/market/candles"
         
         headers = {
@@ -91,117 +233,363 @@ def get_deriv_data(symbol, timeframe):
         params = {
             "symbol": api_symbol,
             "granularity": timeframe,
-            "count": 200
+            "count": CANDLE_COUNT
         }
 
-        response = requests.get(url, headers=headers, params=params)
+        response = SESSION.get(url, headers=headers, params=params, timeout=REQUEST_TIMEOUT)
         app.logger.info(f"API Request: {response.url}")
         
         if response.status_code != 200:
             app.logger.error(f"API Error {response.status_code}: {response.text}")
             return None
 
-        data = response.json()
+        data = orjson.loads(response.content)
         
         if 'error' in data:
             app.logger.error(f"Deriv API Error: {data['error']['message']}")
             return None
 
-        # Create DataFrame
-        df = pd.DataFrame(data['candles'])
-        df = df.rename(columns={
-            'epoch': 'time',
-            'open': 'open',
-            'high': 'high',
-            'low': 'low',
-            'close': 'close'
-        })
-        df['time'] = pd.to_datetime(df['time'], unit='s')
-        return df.set_index('time').astype(float)
+        candles = data['candles']
+        if not candles:
+            app.logger.error(f"Deriv API Error: no candles for {api_symbol} {timeframe}")
+            return None
+
+        # One float64 array per field; prices may arrive as strings
+        n = len(candles)
+        return Candles(*(
+            np.fromiter((c[field] for c in candles), dtype=np.float64, count=n)
+            for field in ('open', 'high', 'low', 'close')
+        ))
 
     except Exception as e:
         app.logger.error(f"Data Error: {str(e)}")
         return None
 
-def calculate_winrate(data):
-    """Calculate historical winrate"""
-    if len(data) < 100: return "N/A"
-    changes = data['close'].pct_change().dropna()
-    return f"{(len(changes[changes > 0])/len(changes))*100:.1f}%"
-
-def determine_trend(data):
-    """EMA Trend Detection"""
-    if len(data) < 50: return "N/A"
-    data['EMA20'] = ta.ema(data['close'], 20)
-    data['EMA50'] = ta.ema(data['close'], 50)
-    return "Up trend" if data['EMA20'].iloc[-1] > data['EMA50'].iloc[-1] else "Down trend"
+# ======== DERIV STREAMING ========
+class CandleBuffer:
+    """Ring buffer of the latest candles as epoch/open/high/low/close rows of a 5xN array"""
+
+    def __init__(self, size=CANDLE_COUNT):
+        self.data = np.empty((5, size), dtype=np.float64)
+        self.index = 0  # Next write position
+        self.count = 0
+        self.closed_up = 0  # Up closes among closed candles, i.e. excluding the forming one
+
+    def load(self, candles):
+        """Replace contents with a ticks_history candle list"""
+        self.index = self.count = self.closed_up = 0
+        for c in candles[-self.data.shape[1]:]:
+            self.append(c['epoch'], c['open'], c['high'], c['low'], c['close'])
+
+    def append(self, epoch, o, h, l, c):
+        size = self.data.shape[1]
+        close = self.data[4]
+        if self.count == size:
+            # The oldest candle is overwritten, so its pair with the next one leaves the window
+            self.closed_up -= int(close[(self.index + 1) % size] > close[self.index])
+        if self.count >= 2:
+            # The previously forming candle is now closed
+            self.closed_up += int(close[self.index - 1] > close[self.index - 2])
+        self.data[:, self.index] = (epoch, o, h, l, c)
+        self.index = (self.index + 1) % size
+        self.count = min(self.count + 1, size)
+
+    def update(self, epoch, o, h, l, c):
+        """Apply an ohlc update; True if it started a new candle"""
+        last = self.index - 1
+        if self.count and self.data[0, last] == epoch:
+            self.data[:, last] = (epoch, o, h, l, c)
+            return False
+        self.append(epoch, o, h, l, c)
+        return True
+
+    def up_ratio(self):
+        """Fraction of candles that closed above the previous close, in O(1)"""
+        if self.count < 2:
+            return np.nan
+        close = self.data[4]
+        forming_up = close[self.index - 1] > close[self.index - 2]
+        return (self.closed_up + forming_up) / (self.count - 1)
+
+    def candles(self):
+        """Snapshot the buffer as oldest-to-newest Candles"""
+        if self.count < self.data.shape[1]:
+            rows = self.data[:, :self.count].copy()
+        else:
+            rows = np.concatenate((self.data[:, self.index:], self.data[:, :self.index]), axis=1)
+        return Candles(rows[1], rows[2], rows[3], rows[4])
+
+class StreamingEMA:
+    """O(1) EMA: `base` covers closed candles, `value` includes the forming one"""
+    __slots__ = ('alpha', 'base', 'value')
+
+    def __init__(self, period, base):
+        self.alpha = 2.0 / (period + 1)
+        self.base = self.value = base
+
+    def update(self, x):
+        self.value = self.alpha * x + (1 - self.alpha) * self.base
+
+    def commit(self):
+        """Fold the forming candle in once it has closed"""
+        self.base = self.value
+
+class StreamingATR:
+    """O(1) Wilder ATR: `base` covers closed candles, `value` includes the forming one"""
+    __slots__ = ('period', 'base', 'value', 'prev_close', 'close')
+
+    def __init__(self, period, base, prev_close):
+        self.period = period
+        self.base = self.value = base
+        self.prev_close = self.close = prev_close
+
+    def update(self, high, low, close):
+        tr = max(high - low, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.value = (self.base * (self.period - 1) + tr) / self.period
+        self.close = close
+
+    def commit(self):
+        """Fold the forming candle in once it has closed"""
+        self.base = self.value
+        self.prev_close = self.close
+
+def _seed_indicators(key, candles):
+    """Start indicators from history; the last candle is still forming"""
+    h, l, c = candles.h[:-1], candles.l[:-1], candles.c[:-1]
+    indicators = (
+        StreamingEMA(20, ema(c, 20)[-1]),
+        StreamingEMA(50, ema(c, 50)[-1]),
+        StreamingATR(14, atr(h, l, c, 14)[-1], c[-1]),
+    )
+    indicators[0].update(candles.c[-1])
+    indicators[1].update(candles.c[-1])
+    indicators[2].update(candles.h[-1], candles.l[-1], candles.c[-1])
+    for name, indicator in zip(STREAM_INDICATORS, indicators):
+        _INDICATORS[key + (name,)] = indicator
+
+def stream_indicators(api_symbol, timeframe):
+    """Latest (ema20, ema50, atr14, up_ratio) from the stream, or None if not warm"""
+    key = (api_symbol, timeframe)
+    with _STREAM_LOCK:
+        buffer = _BUFFERS.get(key)
+        indicators = [_INDICATORS.get(key + (name,)) for name in STREAM_INDICATORS]
+        if buffer is None or None in indicators:
+            return None
+        # Read values under the lock so all of them come from the same tick
+        return tuple(indicator.value for indicator in indicators) + (buffer.up_ratio(),)
+
+def stream_candles(api_symbol, timeframe):
+    """Latest streamed candles, or None if the feed isn't warm for this key"""
+    with _STREAM_LOCK:
+        buffer = _BUFFERS.get((api_symbol, timeframe))
+        return buffer.candles() if buffer is not None else None
+
+def stream_subscribe(api_symbol, timeframe):
+    """Add a symbol/timeframe to the background feed, starting it on first use"""
+    global _stream_loop
+    if websockets is None or api_symbol not in KNOWN_API_SYMBOLS or timeframe not in GRANULARITY_SECONDS:
+        return
+    key = (api_symbol, timeframe)
+    with _STREAM_LOCK:
+        if key in _SUBSCRIPTIONS:
+            return
+        _SUBSCRIPTIONS.add(key)
+        if _stream_loop is None:
+            # The feed subscribes every registered key when it connects
+            _stream_loop = asyncio.new_event_loop()
+            threading.Thread(target=_stream_loop.run_forever, name="deriv-stream", daemon=True).start()
+            asyncio.run_coroutine_threadsafe(_stream_main(), _stream_loop)
+            return
+    asyncio.run_coroutine_threadsafe(_stream_send(key), _stream_loop)
+
+async def _stream_send(key):
+    api_symbol, timeframe = key
+    if _stream_ws is None:
+        return
+    await _stream_ws.send(json.dumps({
+        "ticks_history": api_symbol,
+        "style": "candles",
+        "granularity": GRANULARITY_SECONDS[timeframe],
+        "count": CANDLE_COUNT,
+        "end": "latest",
+        "subscribe": 1
+    }))
+
+async def _stream_main():
+    """Keep the WebSocket connection alive, resubscribing after every reconnect"""
+    global _stream_ws
+    while True:
+        try:
+            async with websockets.connect(DERIV_WS_URL, ping_interval=30) as ws:
+                _stream_ws = ws
+                with _STREAM_LOCK:
+                    keys = list(_SUBSCRIPTIONS)
+                for key in keys:
+                    await _stream_send(key)
+                async for raw in ws:
+                    _on_stream_message(orjson.loads(raw))
+        except Exception as e:
+            app.logger.error(f"Stream Error: {str(e)}")
+        finally:
+            # Buffers go stale while disconnected; fall back to REST until resubscribed
+            _stream_ws = None
+            with _STREAM_LOCK:
+                _BUFFERS.clear()
+                _INDICATORS.clear()
+        await asyncio.sleep(5)
+
+def _on_stream_message(msg):
+    if 'error' in msg:
+        app.logger.error(f"Deriv Stream Error: {msg['error']['message']}")
+        return
+
+    msg_type = msg.get('msg_type')
+    if msg_type == 'candles':
+        echo = msg['echo_req']
+        key = (echo['ticks_history'], TIMEFRAME_BY_SECONDS[int(echo['granularity'])])
+        buffer = CandleBuffer()
+        buffer.load(msg['candles'])
+        if not buffer.count:
+            # Same as REST: no candles means no data, so get_deriv_data keeps using REST
+            app.logger.error(f"Deriv Stream Error: no candles for {key[0]} {key[1]}")
+            return
+        with _STREAM_LOCK:
+            _BUFFERS[key] = buffer
+            if buffer.count > 50:
+                _seed_indicators(key, buffer.candles())
+    elif msg_type == 'ohlc':
+        ohlc = msg['ohlc']
+        key = (ohlc['symbol'], TIMEFRAME_BY_SECONDS.get(int(ohlc['granularity'])))
+        with _STREAM_LOCK:
+            buffer = _BUFFERS.get(key)
+            if buffer is None:
+                return
+            high, low, close = float(ohlc['high']), float(ohlc['low']), float(ohlc['close'])
+            new_candle = buffer.update(float(ohlc['open_time']), float(ohlc['open']), high, low, close)
+            for name in STREAM_INDICATORS:
+                indicator = _INDICATORS.get(key + (name,))
+                if indicator is None:
+                    continue
+                if new_candle:
+                    indicator.commit()
+                if name.startswith('atr'):
+                    indicator.update(high, low, close)
+                else:
+                    indicator.update(close)
+# ==================================
+
+def ema(close, period):
+    """Exponential moving average as a float64 array"""
+    return talib.EMA(close, timeperiod=period)
+
+def atr(high, low, close, period):
+    """Average True Range as a float64 array"""
+    return talib.ATR(high, low, close, timeperiod=period)
 
 def analyze_volatility(symbol):
     """Market analysis with Deriv-specific parameters"""
     try:
-        # Get 15m data for trend
-        df_15m = get_deriv_data(symbol, TIMEFRAMES['analysis'])
-        if df_15m is None or len(df_15m) < 100:
+        # Fetch all timeframes concurrently
+        futures = {
+            name: FETCH_POOL.submit(get_deriv_data, symbol, timeframe)
+            for name, timeframe in TIMEFRAMES.items()
+        }
+
+        # 15m data for trend
+        candles_15m = futures['analysis'].result()
+        if candles_15m is None or len(candles_15m) < 100:
             app.logger.error(f"Error: Insufficient 15m data for {symbol}")
             return None
 
-        # Get 5m data for SL
-        df_5m = get_deriv_data(symbol, TIMEFRAMES['sl'])
-        if df_5m is None or len(df_5m) < 50:
+        # 5m data for SL
+        candles_5m = futures['sl'].result()
+        if candles_5m is None or len(candles_5m) < 50:
             app.logger.error(f"Error: Insufficient 5m data for {symbol}")
             return None
 
-        # Get 1m data for entry
-        df_1m = get_deriv_data(symbol, TIMEFRAMES['entry'])
-        if df_1m is None or len(df_1m) < 10:
+        # 1m data for entry
+        candles_1m = futures['entry'].result()
+        if candles_1m is None or len(candles_1m) < 10:
             app.logger.error(f"Error: Insufficient 1m data for {symbol}")
             return None
 
-        # Calculate ATRs
-        df_5m['ATR'] = ta.atr(df_5m['high'], df_5m['low'], df_5m['close'], 14)
-        df_15m['ATR'] = ta.atr(df_15m['high'], df_15m['low'], df_15m['close'], 14)
-        atr_sl = df_5m['ATR'].iloc[-1]
-        atr_tp = df_15m['ATR'].iloc[-1]
+        api_symbol = convert_symbol_upper(symbol)
+        streamed_15m = stream_indicators(api_symbol, TIMEFRAMES['analysis'])
+        streamed_5m = stream_indicators(api_symbol, TIMEFRAMES['sl'])
+
+        if streamed_15m is not None:
+            # Live EMAs/ATR/winrate are maintained incrementally by the stream
+            ema20, ema50, atr_tp, up_ratio = streamed_15m
+            support = candles_15m.l[-50:].min()
+            resistance = candles_15m.h[-50:].max()
+        else:
+            # 15m indicators in a single pass: EMA trend, TP ATR, support/resistance, winrate
+            ema20, ema50, atr_tp, support, resistance, up_ratio = analyze_kernel(
+                candles_15m.h, candles_15m.l, candles_15m.c
+            )
 
-        # Support/Resistance
-        support = df_15m['low'].rolling(50).min().iloc[-1]
-        resistance = df_15m['high'].rolling(50).max().iloc[-1]
-        last_close = df_1m['close'].iloc[-1]
+        if streamed_5m is not None:
+            atr_sl = streamed_5m[2]
+        else:
+            atr_sl = atr(candles_5m.h, candles_5m.l, candles_5m.c, 14)[-1]
+        last_close = candles_1m.c[-1]
         buffer = 0.005 * (resistance - support)
 
         # Signal detection
-        trend = determine_trend(df_15m)
-        signal = None
-        
-        if last_close > (resistance + buffer) and trend == "Up trend":
-            signal = ('BUY', last_close, last_close - (atr_sl * 3))
-        elif last_close < (support - buffer) and trend == "Down trend":
-            signal = ('SELL', last_close, last_close + (atr_sl * 3))
+        trend_up = ema20 > ema50
+        trend = "Up trend" if trend_up else "Down trend"
+        breakout_up = last_close > (resistance + buffer) and trend_up
+        breakout_dn = last_close < (support - buffer) and not trend_up
+        direction = 'BUY' if breakout_up else 'SELL' if breakout_dn else None
 
-        if not signal:
+        if direction is None:
             app.logger.info(f"No signal: {symbol} at {last_close:.5f}")
             return None
 
-        # Calculate targets
-        direction, entry, sl = signal
-        tp1 = entry + (atr_tp * 1) if direction == 'BUY' else entry - (atr_tp * 1)
-        tp2 = entry + (atr_tp * 2) if direction == 'BUY' else entry - (atr_tp * 2)
+        # Calculate levels
+        sign = 1 if breakout_up else -1
+        entry = last_close
+        sl = entry - 3 * sign * atr_sl
+        tp1 = entry + sign * atr_tp
+        tp2 = entry + 2 * sign * atr_tp
 
         return {
             'symbol': symbol,
             'signal': direction,
-            'winrate': calculate_winrate(df_15m),
+            'winrate': f"{up_ratio*100:.1f}%",
             'trend': trend,
-            'entry': round(entry, 5),
-            'sl': round(sl, 5),
-            'tp1': round(tp1, 5),
-            'tp2': round(tp2, 5)
+            'entry': entry,
+            'sl': sl,
+            'tp1': tp1,
+            'tp2': tp2
         }
 
     except Exception as e:
         app.logger.error(f"Analysis Error: {str(e)}")
         return None
 
+def twiml_message(text):
+    """Serialize a single-message TwiML response"""
+    response = MessagingResponse()
+    response.message(text)
+    return str(response)
+
+# Static replies are serialized once at import
+HELP_TWIML = twiml_message(
+    "📈 Deriv Multi-Asset Bot 📈\n"
+    "Supported Instruments:\n"
+    "Volatility Indices:\n"
+    "• VOLATILITY25/50/75/100\n"
+    "Boom & Crash:\n"
+    "• BOOM500/1000\n• CRASH500/1000\n"
+    "Forex Pairs:\n"
+    "• EURUSD • GBPUSD • USDJPY\n• AUDUSD • USDCAD • USDCHF • NZDUSD\n"
+    "Commodities:\n• XAUUSD (Gold) • XAGUSD (Silver)\n"
+    "Jump Indices:\n• JUMP10/25/50/75/100\n\n"
+    "Commands:\n➤ Analysis: SYMBOL\n➤ Price: PRICE SYMBOL"
+)
+INVALID_TWIML = twiml_message("❌ Invalid command. Send 'HI' for help")
+
 @app.route("/")
 def home():
     return "Deriv Multi-Asset Bot - Operational"
@@ -209,30 +597,15 @@ def home():
 @app.route("/webhook", methods=["POST"])
 def webhook():
     incoming_msg = request.form.get("Body").strip().upper()
-    response = MessagingResponse()
 
     if incoming_msg in ["HI", "HELLO", "START"]:
-        response.message(
-            "📈 Deriv Multi-Asset Bot 📈\n"
-            "Supported Instruments:\n"
-            "Volatility Indices:\n"
-            "• VOLATILITY25/50/75/100\n"
-            "Boom & Crash:\n"
-            "• BOOM500/1000\n• CRASH500/1000\n"
-            "Forex Pairs:\n"
-            "• EURUSD • GBPUSD • USDJPY\n• AUDUSD • USDCAD • USDCHF • NZDUSD\n"
-            "Commodities:\n• XAUUSD (Gold) • XAGUSD (Silver)\n"
-            "Jump Indices:\n• JUMP10/25/50/75/100\n\n"
-            "Commands:\n➤ Analysis: SYMBOL\n➤ Price: PRICE SYMBOL"
-        )
-        return str(response)
+        return HELP_TWIML
 
     if incoming_msg.startswith("PRICE "):
         symbol = incoming_msg.split(" ")[1]
-        df = get_deriv_data(symbol, '1m')
-        price = df['close'].iloc[-1] if df is not None else None
-        response.message(f"Current {symbol}: {price:.5f}" if price else "❌ Price unavailable")
-        return str(response)
+        candles = get_deriv_data(symbol, '1m')
+        price = candles.c[-1] if candles is not None else None
+        return twiml_message(f"Current {symbol}: {price:.5f}" if price else "❌ Price unavailable")
 
     if incoming_msg in SYMBOL_MAP:
         symbol = incoming_msg
@@ -250,23 +623,22 @@ def webhook():
         else:
             msg = f"No current opportunity in {symbol}"
 
-        response.message(msg)
-        return str(response)
+        return twiml_message(msg)
 
-    response.message("❌ Invalid command. Send 'HI' for help")
-    return str(response)
+    return INVALID_TWIML
 
 @app.route("/debug/<symbol>")
 def debug(symbol):
     try:
         api_symbol = convert_symbol(symbol)
-        response = requests.get(
+        response = SESSION.get(
             f"{DERIV_API_URL}/market/candles",
             headers={
                 "Authorization": f"Bearer {DERIV_API_KEY}",
                 "X-App-ID": DERIV_APP_ID
             },
-            params={"symbol": api_symbol, "granularity": "15m", "count": 1}
+            params={"symbol": api_symbol, "granularity": "15m", "count": 1},
+            timeout=REQUEST_TIMEOUT
         )
         return jsonify({
             "symbol_mapping": f"{symbol} -> {api_symbol}",